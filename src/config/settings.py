@@ -8,6 +8,7 @@ Configuration can be loaded from environment variables or passed directly.
 import os
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List
 from enum import Enum
 
@@ -78,6 +79,26 @@ class ConnectionConfig:
             raise ValueError("max_redirects must be non-negative")
 
 
+@lru_cache(maxsize=1024)
+def _build_raw_dir(prefix: str, station_id: str, date: str) -> str:
+    """Build a raw S3 key's day directory from YYYYMMDD (memoized per day)."""
+    return f"{prefix}/{station_id}/{date[:4]}/{date[4:6]}/{date[6:8]}/"
+
+
+@lru_cache(maxsize=1024)
+def _build_parsed_key(prefix: str, station_id: str, year_month: str) -> str:
+    """Build a parsed JSON S3 key (memoized)."""
+    year = year_month[:4]
+    month = year_month[4:6]
+    return f"{prefix}/{station_id}/{year}/{month}/{station_id}_flow_{year_month}.json"
+
+
+@lru_cache(maxsize=1024)
+def _build_latest_key(prefix: str, station_id: str) -> str:
+    """Build a latest aggregated S3 key (memoized)."""
+    return f"{prefix}/{station_id}_latest.json"
+
+
 @dataclass
 class S3Config:
     """Configuration for S3 storage."""
@@ -102,12 +123,9 @@ class S3Config:
         Returns:
             Full S3 key path
         """
-        date_part = timestamp[:8]  # YYYYMMDD
-        year = date_part[:4]
-        month = date_part[4:6]
-        day = date_part[6:8]
-
-        return f"{self.raw_prefix}/{station_id}/{year}/{month}/{day}/{filename}"
+        # Timestamps and filenames change every collection, so only the
+        # day directory is worth caching
+        return _build_raw_dir(self.raw_prefix, station_id, timestamp[:8]) + filename
 
     def get_parsed_key(self, station_id: str, year_month: str) -> str:
         """
@@ -120,9 +138,7 @@ class S3Config:
         Returns:
             Full S3 key path
         """
-        year = year_month[:4]
-        month = year_month[4:6]
-        return f"{self.parsed_prefix}/{station_id}/{year}/{month}/{station_id}_flow_{year_month}.json"
+        return _build_parsed_key(self.parsed_prefix, station_id, year_month)
 
     def get_latest_key(self, station_id: str) -> str:
         """
@@ -134,7 +150,7 @@ class S3Config:
         Returns:
             Full S3 key path
         """
-        return f"{self.aggregated_prefix}/{station_id}_latest.json"
+        return _build_latest_key(self.aggregated_prefix, station_id)
 
 
 @dataclass
@@ -13,6 +13,9 @@ from ..utils.logger import StructuredLogger
 
 logger = StructuredLogger(__name__)
 
+# Streaming read size; ~100 KiB keeps per-chunk overhead low for requests
+DOWNLOAD_CHUNK_SIZE = 131072
+
 
 class HTTPConnector:
     """
@@ -95,14 +98,16 @@ class HTTPConnector:
                     url=url
                 )
 
-            # Download in chunks to handle large files
-            content = b''
-            for chunk in response.iter_content(chunk_size=8192):
+            # Download in chunks, hashing each as it arrives
+            hasher = hashlib.sha256()
+            buffer = bytearray()
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:  # Filter out keep-alive chunks
-                    content += chunk
+                    hasher.update(chunk)
+                    buffer += chunk
 
-            # Calculate SHA-256 hash
-            file_hash = hashlib.sha256(content).hexdigest()
+            content = bytes(buffer)
+            file_hash = hasher.hexdigest()
 
             logger.info(
                 "Download successful",
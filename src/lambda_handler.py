@@ -7,6 +7,7 @@ on a schedule to download and process river data.
 
 import json
 import os
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -15,11 +16,15 @@ from .connectors.http_connector import HTTPConnector
 from .parsers.esb_hydro_parser import ESBHydroFlowParser
 from .parsers.waterlevel_parser import WaterLevelParser
 from .storage.s3_storage import S3Storage
-from .utils.logger import setup_logging, StructuredLogger
+from .utils.logger import setup_logging, flush_logging, flush_logs_after, StructuredLogger
 from .utils.retry import retry_with_backoff
 
 logger = StructuredLogger(__name__)
 
+# Time reserved after the last download for parsing and S3 uploads; the
+# download timeout itself is added on top (see lambda_handler)
+DEADLINE_MARGIN_MS = 5000
+
 # Cache for SSM parameter values (persists across warm Lambda invocations)
 _ssm_cache: Dict[str, str] = {}
 
@@ -46,6 +51,7 @@ def _get_ssm_or_env(name: str) -> str:
     return os.environ.get(name, "")
 
 
+@flush_logs_after
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler for downloading river data.
@@ -92,8 +98,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     request_id = context.request_id if hasattr(context, 'request_id') else 'unknown'
 
-    # Setup logging
-    setup_logging()
+    # Setup logging (buffered; flushed by @flush_logs_after before returning)
+    setup_logging(buffered=True)
 
     logger.info(
         "Lambda invocation started",
@@ -103,10 +109,26 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         event_time=event.get('time')
     )
 
+    connector = None
     try:
         # Load configuration from environment
         settings = Settings.from_env()
 
+        # Last moment a download retry may start: it can still run for the
+        # full connection timeout, then parsing and uploads need their margin
+        deadline_ns = None
+        if hasattr(context, 'get_remaining_time_in_millis'):
+            remaining_ms = (
+                context.get_remaining_time_in_millis()
+                - settings.connection.timeout_seconds * 1000
+                - DEADLINE_MARGIN_MS
+            )
+            deadline_ns = time.monotonic_ns() + max(remaining_ms, 0) * 1_000_000
+
+        # One session for the whole invocation so connections are reused
+        # across sources on the same host
+        connector = HTTPConnector(settings.connection)
+
         logger.info(
             "Configuration loaded",
             environment=settings.environment,
@@ -128,15 +150,15 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 # Parse content based on source type
                 if source_config.source_type == DataSourceType.PDF:
                     # ESB Hydro PDF parsing
-                    with HTTPConnector(settings.connection) as connector:
-                        # Download with retry logic
-                        def download_fn():
-                            return connector.download_file(source_config.url)
-
-                        content, file_hash = retry_with_backoff(
-                            download_fn,
-                            settings.retry
-                        )
+                    # Download with retry logic
+                    def download_fn():
+                        return connector.download_file(source_config.url)
+
+                    content, file_hash = retry_with_backoff(
+                        download_fn,
+                        settings.retry,
+                        deadline_ns=deadline_ns
+                    )
 
                     logger.info(
                         f"Successfully downloaded {source_config.name}",
@@ -164,22 +186,23 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                         temp_url=temp_url
                     )
 
-                    with HTTPConnector(settings.connection) as connector:
-                        # Download level CSV
-                        def download_level_fn():
-                            return connector.download_file(level_url)
-                        level_csv, level_hash = retry_with_backoff(
-                            download_level_fn,
-                            settings.retry
-                        )
+                    # Download level CSV
+                    def download_level_fn():
+                        return connector.download_file(level_url)
+                    level_csv, level_hash = retry_with_backoff(
+                        download_level_fn,
+                        settings.retry,
+                        deadline_ns=deadline_ns
+                    )
 
-                        # Download temperature CSV
-                        def download_temp_fn():
-                            return connector.download_file(temp_url)
-                        temp_csv, temp_hash = retry_with_backoff(
-                            download_temp_fn,
-                            settings.retry
-                        )
+                    # Download temperature CSV
+                    def download_temp_fn():
+                        return connector.download_file(temp_url)
+                    temp_csv, temp_hash = retry_with_backoff(
+                        download_temp_fn,
+                        settings.retry,
+                        deadline_ns=deadline_ns
+                    )
 
                     file_hash = f"{level_hash[:16]}+{temp_hash[:16]}"
 
@@ -328,6 +351,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     "error_type": type(e).__name__
                 })
 
+            finally:
+                # Write this source's logs now; a Lambda timeout later in
+                # the run would otherwise drop them with the buffer
+                flush_logging()
+
         # Calculate success metrics
         success_count = sum(1 for r in results if r.get("success", False))
         total_count = len(results)
@@ -381,6 +409,10 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             "body": json.dumps(error_response)
         }
 
+    finally:
+        if connector is not None:
+            connector.close()
+
 
 def _get_previous_inniscarra_flow(s3_bucket: str) -> Optional[float]:
     """
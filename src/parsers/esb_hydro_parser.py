@@ -5,7 +5,8 @@ Extracts flow rate data from ESB Hydro PDF reports for Inniscarra station.
 """
 
 import io
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
 import pdfplumber
@@ -15,9 +16,28 @@ from ..utils.logger import StructuredLogger
 logger = StructuredLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_ts_cached(timestamp_str: str) -> datetime:
+    """
+    Parse an ESB timestamp, memoized by string.
+
+    The PDF table repeats the same hourly timestamps on every download,
+    so most calls are cache hits. datetime is immutable, so sharing the
+    cached instance is safe.
+    """
+    dt = datetime.strptime(timestamp_str, "%d-%b-%y %H:%M:%S")
+
+    # Convert 2-digit year to 4-digit
+    # Assume 00-50 is 2000-2050, 51-99 is 1951-1999
+    if dt.year < 1970:
+        dt = dt.replace(year=dt.year + 2000)
+
+    return dt
+
+
+@dataclass(slots=True, frozen=True)
 class FlowReading:
-    """Single flow rate reading."""
+    """Single flow rate reading (immutable, no per-instance __dict__)."""
     timestamp: datetime
     flow_rate_m3s: float
     units: str = "cubic meters per second"
@@ -30,6 +50,14 @@ class FlowReading:
             "units": self.units
         }
 
+    def statistics_dict(self) -> Dict[str, Any]:
+        """Current-value statistics for the latest aggregated file."""
+        return {"current_flow_m3s": self.flow_rate_m3s}
+
+    def metadata_dict(self) -> Dict[str, str]:
+        """S3 object metadata for the latest aggregated file."""
+        return {"flow-rate": str(self.flow_rate_m3s)}
+
 
 @dataclass
 class ParsedFlowData:
@@ -131,7 +159,7 @@ class ESBHydroFlowParser:
                     river=self.river_name,
                     current_reading=current_reading,
                     historical_readings=historical_readings,
-                    parsed_at=datetime.utcnow(),
+                    parsed_at=datetime.now(timezone.utc).replace(tzinfo=None),
                     source_hash=source_hash
                 )
 
@@ -307,14 +335,7 @@ class ESBHydroFlowParser:
         """
         try:
             # Parse format: "05-Dec-25 17:00:00"
-            dt = datetime.strptime(timestamp_str, "%d-%b-%y %H:%M:%S")
-
-            # Convert 2-digit year to 4-digit
-            # Assume 00-50 is 2000-2050, 51-99 is 1951-1999
-            if dt.year < 1970:
-                dt = dt.replace(year=dt.year + 2000)
-
-            return dt
+            return _parse_ts_cached(timestamp_str)
 
         except ValueError as e:
             logger.error(
@@ -7,7 +7,8 @@ Station 19102 is Waterworks Weir on the River Lee.
 
 import csv
 import io
-from datetime import datetime
+import re
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
 
@@ -15,10 +16,25 @@ from ..utils.logger import StructuredLogger
 
 logger = StructuredLogger(__name__)
 
+# Temperature readings are hourly and may lag the 15-minute level readings
+TEMP_MATCH_WINDOW_SECONDS = 7200
+_TEMP_MATCH_WINDOW = timedelta(seconds=TEMP_MATCH_WINDOW_SECONDS)
 
-@dataclass
+# Every data row starts with a timestamp, so content without a digit has none
+_DIGIT = re.compile(rb'[0-9]')
+
+
+def _strptime_timestamp(timestamp_str: str) -> datetime:
+    """Parse a timestamp with the original strptime formats (slow path)."""
+    try:
+        return datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M")
+
+
+@dataclass(slots=True, frozen=True)
 class WaterLevelReading:
-    """Single water level reading with temperature."""
+    """Single water level reading with temperature (immutable, no per-instance __dict__)."""
     timestamp: datetime
     water_level_m: Optional[float]  # meters
     temperature_c: Optional[float]  # celsius
@@ -31,6 +47,20 @@ class WaterLevelReading:
             "temperature_c": self.temperature_c
         }
 
+    def statistics_dict(self) -> Dict[str, Any]:
+        """Current-value statistics for the latest aggregated file."""
+        return {
+            "current_water_level_m": self.water_level_m,
+            "current_temperature_c": self.temperature_c
+        }
+
+    def metadata_dict(self) -> Dict[str, str]:
+        """S3 object metadata for the latest aggregated file."""
+        return {
+            "water-level": str(self.water_level_m),
+            "temperature": str(self.temperature_c)
+        }
+
 
 @dataclass
 class ParsedWaterLevelData:
@@ -126,6 +156,11 @@ class WaterLevelParser:
         )
 
         try:
+            # Reject empty or digit-free level data up front rather than
+            # walking every row of it
+            if not _DIGIT.search(level_csv):
+                raise ValueError("No valid readings found in CSV data")
+
             # Parse both CSVs
             level_readings = self._parse_csv(level_csv)
             temp_readings = self._parse_csv(temp_csv)
@@ -152,7 +187,7 @@ class WaterLevelParser:
                 river=self.river_name,
                 current_reading=current_reading,
                 historical_readings=historical_readings,
-                parsed_at=datetime.utcnow(),
+                parsed_at=datetime.now(timezone.utc).replace(tzinfo=None),
                 source_hash=source_hash
             )
 
@@ -185,48 +220,95 @@ class WaterLevelParser:
         Returns:
             List of (datetime, float) tuples sorted by timestamp descending
         """
-        readings = []
-
         try:
-            text = csv_content.decode('utf-8')
+            readings = self._read_rows(csv_content, 'utf-8')
         except UnicodeDecodeError:
             logger.warning("Failed to decode as UTF-8, trying latin-1")
-            text = csv_content.decode('latin-1')
+            readings = self._read_rows(csv_content, 'latin-1')
+
+        # Sort by timestamp descending (most recent first)
+        readings.sort(key=lambda x: x[0], reverse=True)
+
+        logger.debug(f"Parsed {len(readings)} readings from CSV")
+
+        return readings
+
+    def _read_rows(self, csv_content: bytes, encoding: str) -> List[tuple]:
+        """
+        Decode and parse CSV rows in a single streaming pass.
 
-        reader = csv.reader(io.StringIO(text))
+        Args:
+            csv_content: CSV file content as bytes
+            encoding: Text encoding to decode with
+
+        Returns:
+            List of (datetime, float) tuples in file order
 
-        for row in reader:
+        Raises:
+            UnicodeDecodeError: If content cannot be decoded with encoding
+        """
+        readings = []
+
+        # Decode incrementally rather than materializing the whole text
+        stream = io.TextIOWrapper(io.BytesIO(csv_content), encoding=encoding, newline='')
+
+        if b'"' in csv_content:
+            rows = csv.reader(stream)
+        else:
+            # Fast path: the waterlevel.ie feeds are unquoted (timestamp, value)
+            # pairs, so a plain split is equivalent to csv.reader without the
+            # per-character tokenizer
+            rows = (line.split(',') for line in stream)
+
+        # Bound once rather than looked up on every row
+        fromisoformat = datetime.fromisoformat
+        append = readings.append
+
+        for row in rows:
             if len(row) < 2:
                 continue
 
+            timestamp_str = row[0].strip()
+
+            # Zero-padded "YYYY-MM-DD HH:MM[:SS]" (every row the feeds emit)
+            # goes to the C fromisoformat parser. Anything else that starts
+            # with a digit falls back to strptime, which also accepts
+            # unpadded fields such as "2025-12-06 1:30:00" but rejects the
+            # other ISO forms (date only, "T" separator, basic format).
+            # Headers and other non-data rows are skipped without raising.
+            if (
+                len(timestamp_str) in (16, 19)
+                and timestamp_str[4] == '-'
+                and timestamp_str[7] == '-'
+                and timestamp_str[10] == ' '
+                and timestamp_str[:4].isdigit()
+            ):
+                parse_timestamp = fromisoformat
+            elif timestamp_str[:1].isdigit():
+                parse_timestamp = _strptime_timestamp
+            else:
+                continue
+
             try:
                 # CSV format: timestamp,value
                 # Example: 2025-12-06 14:30:00,1.590
-                timestamp_str = row[0].strip()
                 value_str = row[1].strip()
 
                 # Parse timestamp (waterlevel.ie uses UTC)
-                # Try with seconds first, then without
-                try:
-                    timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                except ValueError:
-                    timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M")
+                timestamp = parse_timestamp(timestamp_str)
+                if timestamp.tzinfo is not None:
+                    raise ValueError(f"Unexpected UTC offset: {timestamp_str}")
 
                 # Parse value (may be empty or invalid)
                 value = float(value_str) if value_str else None
 
-                readings.append((timestamp, value))
+                append((timestamp, value))
 
             except (ValueError, IndexError) as e:
                 # Skip invalid rows (including header rows)
                 logger.debug(f"Skipping invalid CSV row: {row}, error: {e}")
                 continue
 
-        # Sort by timestamp descending (most recent first)
-        readings.sort(key=lambda x: x[0], reverse=True)
-
-        logger.debug(f"Parsed {len(readings)} readings from CSV")
-
         return readings
 
     def _combine_readings(
@@ -237,21 +319,74 @@ class WaterLevelParser:
         """
         Combine level and temperature readings by timestamp.
 
+        Both lists are sorted by timestamp descending (as returned by
+        _parse_csv), so temperatures are matched with a single merge-join
+        pass instead of a lookup per level reading. An exact timestamp wins,
+        otherwise the closest reading within the 2-hour window (temperatures
+        are hourly and may lag), preferring the later one on a tie.
+
         Args:
-            level_readings: List of (timestamp, level) tuples
-            temp_readings: List of (timestamp, temp) tuples
+            level_readings: List of (timestamp, level) tuples, newest first
+            temp_readings: List of (timestamp, temp) tuples, newest first
 
         Returns:
             List of WaterLevelReading objects sorted by timestamp descending
         """
-        # Create lookup dict for temperature readings
-        temp_dict = {ts: val for ts, val in temp_readings}
+        # No temperature can match if there are none, or if they all fall
+        # outside the window around the level readings' time range
+        if not temp_readings or not level_readings or (
+            temp_readings[-1][0] > level_readings[0][0] + _TEMP_MATCH_WINDOW
+            or temp_readings[0][0] < level_readings[-1][0] - _TEMP_MATCH_WINDOW
+        ):
+            combined = [
+                WaterLevelReading(timestamp=timestamp, water_level_m=level, temperature_c=None)
+                for timestamp, level in level_readings
+            ]
+            logger.debug(f"Combined {len(combined)} readings without temperature")
+            return combined
+
+        # Both series on the same timestamps (same sensor cadence and phase):
+        # pair them by index. Duplicate timestamps take the join below so the
+        # last duplicate temperature still wins.
+        if len(level_readings) == len(temp_readings) and level_readings[0][0] == temp_readings[0][0]:
+            level_ts = [timestamp for timestamp, _ in level_readings]
+            if level_ts == [timestamp for timestamp, _ in temp_readings] and len(set(level_ts)) == len(level_ts):
+                combined = [
+                    WaterLevelReading(timestamp=timestamp, water_level_m=level, temperature_c=temp)
+                    for (timestamp, level), (_, temp) in zip(level_readings, temp_readings)
+                ]
+                logger.debug(f"Combined {len(combined)} readings by index")
+                return combined
 
         combined = []
+        temp_count = len(temp_readings)
+        j = 0
 
         for timestamp, level in level_readings:
-            # Find matching temperature reading (within 5 minutes)
-            temp = self._find_matching_temp(timestamp, temp_dict)
+            # Skip temperatures later than this reading; the one before j is
+            # then the closest later reading
+            while j < temp_count and temp_readings[j][0] > timestamp:
+                j += 1
+
+            temp = None
+            best_diff = float('inf')
+
+            if j > 0:
+                later_ts, later_temp = temp_readings[j - 1]
+                diff = (later_ts - timestamp).total_seconds()
+                if diff <= TEMP_MATCH_WINDOW_SECONDS:
+                    temp, best_diff = later_temp, diff
+
+            if j < temp_count:
+                # Closest reading at or before timestamp; with duplicate
+                # timestamps the last one in the file wins, as in a dict
+                k = j
+                while k + 1 < temp_count and temp_readings[k + 1][0] == temp_readings[j][0]:
+                    k += 1
+                earlier_ts, earlier_temp = temp_readings[k]
+                diff = (timestamp - earlier_ts).total_seconds()
+                if diff == 0 or (diff <= TEMP_MATCH_WINDOW_SECONDS and diff < best_diff):
+                    temp = earlier_temp
 
             combined.append(WaterLevelReading(
                 timestamp=timestamp,
@@ -262,37 +397,3 @@ class WaterLevelParser:
         logger.debug(f"Combined {len(combined)} readings")
 
         return combined
-
-    def _find_matching_temp(
-        self,
-        timestamp: datetime,
-        temp_dict: Dict[datetime, Optional[float]]
-    ) -> Optional[float]:
-        """
-        Find temperature reading that matches timestamp (within 2 hours).
-
-        Temperature readings are hourly but may lag behind water level readings.
-        We use a 2-hour window to ensure we capture the most recent temperature.
-
-        Args:
-            timestamp: Target timestamp
-            temp_dict: Dictionary of timestamp -> temperature
-
-        Returns:
-            Temperature value or None if no match found
-        """
-        # Exact match
-        if timestamp in temp_dict:
-            return temp_dict[timestamp]
-
-        # Find closest within 2 hours (temperature readings are hourly and may lag)
-        best_temp = None
-        best_diff = float('inf')
-
-        for temp_ts, temp_val in temp_dict.items():
-            diff = abs((timestamp - temp_ts).total_seconds())
-            if diff <= 7200 and diff < best_diff:  # 2 hours
-                best_temp = temp_val
-                best_diff = diff
-
-        return best_temp
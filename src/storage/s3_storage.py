@@ -18,6 +18,27 @@ from ..utils.logger import StructuredLogger
 
 logger = StructuredLogger(__name__)
 
+# orjson is optional - fall back to the stdlib encoder if it isn't installed
+try:
+    import orjson
+
+    def _dumps_bytes(obj: Dict[str, Any]) -> bytes:
+        """Serialize a document to indented UTF-8 JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    def _dumps_bytes(obj: Dict[str, Any]) -> bytes:
+        """Serialize a document to indented UTF-8 JSON."""
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Payloads below this size are dominated by fixed overhead; deflating them
+# costs CPU for near-zero transfer savings.
+MIN_DEFLATE_BYTES = 4096
+
+# Deflate level for larger payloads: level 1 is several times cheaper than 9
+# for output only a few percent larger
+GZIP_LEVEL = 1
+
 
 class S3Storage:
     """
@@ -317,12 +338,25 @@ class S3Storage:
                 new_total=len(all_readings)
             )
 
-            json_str = json.dumps(json_data, indent=2)
-            json_bytes = json_str.encode('utf-8')
+            json_bytes = _dumps_bytes(json_data)
 
-            # Compress if requested
+            # Compress if requested. Small payloads are written as stored
+            # (level 0) gzip so the key and ContentEncoding stay unchanged
+            # for readers, without paying for deflate. mtime=0 keeps
+            # identical content byte-identical across uploads.
             if compress:
-                json_bytes = gzip.compress(json_bytes)
+                deflate = len(json_bytes) > MIN_DEFLATE_BYTES
+                logger.debug(
+                    "Gzip compression decision",
+                    station_id=station_id,
+                    size_bytes=len(json_bytes),
+                    deflate=deflate
+                )
+                json_bytes = gzip.compress(
+                    json_bytes,
+                    compresslevel=GZIP_LEVEL if deflate else 0,
+                    mtime=0
+                )
 
             # Prepare put_object kwargs
             put_kwargs = {
@@ -407,33 +441,24 @@ class S3Storage:
                     "historical_readings": len(parsed_data.historical_readings),
                     "time_range_hours": 24
                 },
-                "updated_at": datetime.utcnow().isoformat() + "Z",
+                # Written in the same run as the parse, so reuse its timestamp
+                "updated_at": parsed_data.parsed_at.isoformat() + "Z",
                 "source_hash": parsed_data.source_hash
             }
 
             # Add type-specific statistics
-            if hasattr(parsed_data.current_reading, 'flow_rate_m3s'):
-                aggregated["statistics"]["current_flow_m3s"] = parsed_data.current_reading.flow_rate_m3s
-            if hasattr(parsed_data.current_reading, 'water_level_m'):
-                aggregated["statistics"]["current_water_level_m"] = parsed_data.current_reading.water_level_m
-            if hasattr(parsed_data.current_reading, 'temperature_c'):
-                aggregated["statistics"]["current_temperature_c"] = parsed_data.current_reading.temperature_c
+            aggregated["statistics"].update(parsed_data.current_reading.statistics_dict())
 
-            # Convert to JSON
-            json_str = json.dumps(aggregated, indent=2)
-            json_bytes = json_str.encode('utf-8')
+            # Convert to JSON. The file is small and read on every page load,
+            # so it is stored uncompressed.
+            json_bytes = _dumps_bytes(aggregated)
 
             # Build metadata dict
             metadata = {
                 'station-id': station_id,
                 'timestamp': parsed_data.current_reading.timestamp.isoformat()
             }
-            if hasattr(parsed_data.current_reading, 'flow_rate_m3s'):
-                metadata['flow-rate'] = str(parsed_data.current_reading.flow_rate_m3s)
-            if hasattr(parsed_data.current_reading, 'water_level_m'):
-                metadata['water-level'] = str(parsed_data.current_reading.water_level_m)
-            if hasattr(parsed_data.current_reading, 'temperature_c'):
-                metadata['temperature'] = str(parsed_data.current_reading.temperature_c)
+            metadata.update(parsed_data.current_reading.metadata_dict())
 
             # Prepare put_object kwargs
             put_kwargs = {
@@ -604,6 +629,9 @@ class S3Storage:
         """
         List historical files for a station.
 
+        Results are paginated, so listings are not silently truncated at the
+        1000-key page size.
+
         Args:
             station_id: Station identifier
             prefix_type: Type of files (raw, parsed, aggregated)
@@ -624,16 +652,13 @@ class S3Storage:
                 prefix=prefix
             )
 
-            response = self.s3.list_objects_v2(
+            paginator = self.s3.get_paginator('list_objects_v2')
+            pages = paginator.paginate(
                 Bucket=self.config.bucket_name,
                 Prefix=prefix,
-                MaxKeys=max_files
+                PaginationConfig={'MaxItems': max_files}
             )
-
-            if 'Contents' not in response:
-                return []
-
-            keys = [obj['Key'] for obj in response['Contents']]
+            keys = [obj['Key'] for page in pages for obj in page.get('Contents', [])]
 
             logger.debug(
                 "Listed historical files",
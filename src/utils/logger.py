@@ -6,12 +6,45 @@ AWS CloudWatch Logs and CloudWatch Insights queries.
 """
 
 import logging
+import logging.handlers
 import json
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Optional, TextIO, TypeVar
 from enum import Enum
 
+T = TypeVar('T')
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoder doesn't handle natively."""
+    if isinstance(obj, datetime):
+        # Match orjson's OPT_NAIVE_UTC | OPT_UTC_Z: naive and UTC values get
+        # a Z suffix, other offsets are kept as-is
+        if obj.tzinfo is None:
+            return obj.isoformat() + "Z"
+        text = obj.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    return str(obj)
+
+
+# orjson is optional - fall back to the stdlib encoder if it isn't installed
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        """Serialize a log entry to a JSON string."""
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+
+except ImportError:
+    def _dumps(obj: Dict[str, Any]) -> str:
+        """Serialize a log entry to a JSON string."""
+        return json.dumps(obj, default=_json_default, separators=(",", ":"), ensure_ascii=False)
+
 
 class LogLevel(Enum):
     """Logging levels."""
@@ -22,6 +55,42 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
+# Context added by LogContext blocks (never mutated in place)
+_log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+
+# Hot-path lookups bound once at import time
+_LEVEL_NAMES = {level.value: level.name for level in LogLevel}
+_now = datetime.now
+_UTC = timezone.utc
+
+
+class _LogEntry(dict):
+    """Structured log entry; renders as JSON for any handler's formatter."""
+
+    def __str__(self) -> str:
+        return _dumps(self)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formatter that serializes StructuredLogger entries to JSON.
+
+    StructuredLogger passes its log entry as a dict in record.msg. The dict
+    is serialized here, in a single pass, with any traceback included as an
+    "exception" field so each CloudWatch event stays one JSON document.
+    Records from other loggers are formatted normally.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as JSON if it carries a structured entry."""
+        if isinstance(record.msg, dict):
+            entry = record.msg
+            if record.exc_info:
+                entry = {**entry, "exception": self.formatException(record.exc_info)}
+            return _dumps(entry)
+        return super().format(record)
+
+
 class StructuredLogger:
     """
     Structured logger that outputs JSON-formatted logs.
@@ -45,6 +114,8 @@ class StructuredLogger:
         }
     """
 
+    __slots__ = ('logger', 'name')
+
     def __init__(self, name: str):
         """
         Initialize structured logger.
@@ -55,6 +126,17 @@ class StructuredLogger:
         self.logger = logging.getLogger(name)
         self.name = name
 
+    @property
+    def debug_enabled(self) -> bool:
+        """
+        Whether DEBUG records would be emitted.
+
+        Lets callers skip building expensive debug messages entirely.
+        logging caches isEnabledFor() and clears the cache on level changes,
+        so this stays correct after setup_logging().
+        """
+        return self.logger.isEnabledFor(logging.DEBUG)
+
     def _log(
         self,
         level: int,
@@ -71,27 +153,51 @@ class StructuredLogger:
             context: Additional context as key-value pairs
             exc_info: Include exception information
         """
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "level": logging.getLevelName(level),
+        # Skip building and serializing records that would be discarded
+        if not self.logger.isEnabledFor(level):
+            return
+
+        log_entry = _LogEntry({
+            "timestamp": _now(_UTC).replace(tzinfo=None).isoformat(timespec="milliseconds") + "Z",
+            "level": _LEVEL_NAMES.get(level) or logging.getLevelName(level),
             "logger": self.name,
             "message": message
-        }
+        })
 
         if context:
-            # Filter out None values
-            filtered_context = {
-                k: v for k, v in context.items()
-                if v is not None
-            }
-            if filtered_context:
-                log_entry["context"] = filtered_context
+            # Filter out None values. Most calls have none, so check with a
+            # C-level scan first; **context is already a fresh dict we own.
+            if None in context.values():
+                context = {
+                    k: v for k, v in context.items()
+                    if v is not None
+                }
+            if context:
+                log_entry["context"] = context
+
+        # Hand the dict to the handler; JSONFormatter serializes it once
+        self.logger.log(level, log_entry, exc_info=exc_info)
+
+    def _log_fast(self, level: int, message: str):
+        """
+        Log structured message with no context.
 
-        # For CloudWatch, log as JSON string
-        log_message = json.dumps(log_entry, default=str)
+        Specialization of _log for the common no-kwargs call, skipping the
+        context filtering entirely.
 
-        # Log with exception info if provided
-        self.logger.log(level, log_message, exc_info=exc_info)
+        Args:
+            level: Logging level
+            message: Log message
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+
+        self.logger.log(level, _LogEntry({
+            "timestamp": _now(_UTC).replace(tzinfo=None).isoformat(timespec="milliseconds") + "Z",
+            "level": _LEVEL_NAMES.get(level) or logging.getLevelName(level),
+            "logger": self.name,
+            "message": message
+        }))
 
     def debug(self, message: str, **context):
         """
@@ -101,6 +207,8 @@ class StructuredLogger:
             message: Log message
             **context: Additional context as keyword arguments
         """
+        if not context:
+            return self._log_fast(logging.DEBUG, message)
         self._log(logging.DEBUG, message, context)
 
     def info(self, message: str, **context):
@@ -111,6 +219,8 @@ class StructuredLogger:
             message: Log message
             **context: Additional context as keyword arguments
         """
+        if not context:
+            return self._log_fast(logging.INFO, message)
         self._log(logging.INFO, message, context)
 
     def warning(self, message: str, **context):
@@ -121,6 +231,8 @@ class StructuredLogger:
             message: Log message
             **context: Additional context as keyword arguments
         """
+        if not context:
+            return self._log_fast(logging.WARNING, message)
         self._log(logging.WARNING, message, context)
 
     def error(self, message: str, exc_info: bool = False, **context):
@@ -158,7 +270,66 @@ class StructuredLogger:
         self._log(logging.ERROR, message, context, exc_info=True)
 
 
-def setup_logging(log_level: str = "INFO", structured: bool = True):
+class BufferedStreamHandler(logging.handlers.MemoryHandler):
+    """
+    Handler that batches records and writes them to a stream in one call.
+
+    A plain StreamHandler costs one write (and, unbuffered under Lambda, one
+    syscall) per record. This buffers up to `capacity` records and writes
+    them as a single chunk when the buffer fills, when a record at or above
+    `flushLevel` arrives, or when flush() is called explicitly.
+
+    Under Lambda, call flush_logging() (or decorate the handler with
+    flush_logs_after) so the buffer is written before the invocation
+    returns and the container is frozen. logging.shutdown() flushes any
+    remainder at interpreter exit. A Lambda timeout kills the process
+    without running either, so long-running handlers should also flush at
+    natural checkpoints.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        capacity: int = 256,
+        flushLevel: int = logging.ERROR
+    ):
+        """
+        Initialize buffered handler.
+
+        Args:
+            stream: Stream to write formatted records to
+            capacity: Number of records to buffer before writing
+            flushLevel: Records at or above this level trigger a write
+        """
+        super().__init__(capacity, flushLevel=flushLevel)
+        self.stream = stream
+
+    def flush(self):
+        """Write all buffered records to the stream in a single call."""
+        self.acquire()
+        try:
+            if not self.buffer:
+                return
+            records = self.buffer
+            self.buffer = []
+            lines = []
+            for record in records:
+                try:
+                    lines.append(self.format(record) + "\n")
+                except Exception:
+                    self.handleError(record)
+            # Like StreamHandler.emit, a failed write is reported via
+            # handleError rather than raised into the logging call
+            try:
+                self.stream.write("".join(lines))
+                self.stream.flush()
+            except Exception:
+                self.handleError(records[-1])
+        finally:
+            self.release()
+
+
+def setup_logging(log_level: str = "INFO", structured: bool = True, buffered: bool = False):
     """
     Configure logging for the application.
 
@@ -168,6 +339,7 @@ def setup_logging(log_level: str = "INFO", structured: bool = True):
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         structured: Use structured JSON logging (True for production/Lambda)
+        buffered: Batch writes to stdout (call flush_logging() before returning)
 
     Example:
         >>> setup_logging(log_level="INFO")
@@ -179,17 +351,21 @@ def setup_logging(log_level: str = "INFO", structured: bool = True):
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Remove existing handlers
+    # Remove existing handlers, writing out anything they still buffer
     for handler in root_logger.handlers[:]:
+        handler.flush()
         root_logger.removeHandler(handler)
 
     # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
+    if buffered:
+        handler = BufferedStreamHandler(sys.stdout)
+    else:
+        handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(numeric_level)
 
     if structured:
-        # Simple format for structured logging (we do JSON ourselves)
-        formatter = logging.Formatter('%(message)s')
+        # Structured entries are serialized to JSON by the formatter
+        formatter = JSONFormatter('%(message)s')
     else:
         # Human-readable format for local development
         formatter = logging.Formatter(
@@ -205,14 +381,49 @@ def setup_logging(log_level: str = "INFO", structured: bool = True):
     logger.info(
         "Logging configured",
         log_level=log_level,
-        structured=structured
+        structured=structured,
+        buffered=buffered
     )
 
 
+def flush_logging():
+    """
+    Flush all root logger handlers.
+
+    Call before a Lambda invocation returns so buffered log records reach
+    CloudWatch before the container is frozen.
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+def flush_logs_after(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator that flushes buffered logs when the wrapped function exits.
+
+    Example:
+        >>> @flush_logs_after
+        ... def lambda_handler(event, context):
+        ...     setup_logging(buffered=True)
+        ...     ...
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        try:
+            return func(*args, **kwargs)
+        finally:
+            flush_logging()
+    return wrapper
+
+
 class LogContext:
     """
     Context manager for adding context to all logs within a block.
 
+    The active context lives in a ContextVar, so entering a block swaps in
+    a merged dict rather than copying and mutating shared class state, and
+    concurrent threads or tasks each see their own context.
+
     Example:
         >>> logger = StructuredLogger(__name__)
         >>> with LogContext(request_id="abc-123"):
@@ -220,7 +431,7 @@ class LogContext:
         ...     # request_id will be included in all logs
     """
 
-    _context: Dict[str, Any] = {}
+    __slots__ = ('context', '_token')
 
     def __init__(self, **context):
         """
@@ -230,32 +441,32 @@ class LogContext:
             **context: Context key-value pairs to add to all logs
         """
         self.context = context
-        self.previous_context = {}
+        self._token = None
 
     def __enter__(self):
         """Enter context manager."""
-        # Save previous context
-        self.previous_context = LogContext._context.copy()
-        # Add new context
-        LogContext._context.update(self.context)
+        self._token = _log_context.set({**_log_context.get(), **self.context})
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context manager."""
         # Restore previous context
-        LogContext._context = self.previous_context
+        _log_context.reset(self._token)
 
     @classmethod
     def get_context(cls) -> Dict[str, Any]:
         """Get current context."""
-        return cls._context.copy()
+        return dict(_log_context.get())
 
 
 # Convenience function for creating loggers
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> StructuredLogger:
     """
     Get a structured logger instance.
 
+    Instances are cached per name, mirroring logging.getLogger.
+
     Args:
         name: Logger name (typically __name__ of the module)
 
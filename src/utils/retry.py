@@ -8,6 +8,7 @@ when connecting to external services.
 import time
 import random
 import logging
+import importlib.util
 from typing import Callable, TypeVar, Optional
 from functools import wraps
 from requests.exceptions import HTTPError, ConnectionError, Timeout
@@ -18,6 +19,13 @@ logger = StructuredLogger(__name__)
 
 T = TypeVar('T')
 
+# Jitter resolution: a 20-bit random integer scaled into ±jitter_amount
+_JITTER_BITS = 20
+_getrandbits = random.getrandbits
+
+# Request timeout, too early, rate limiting and all server errors
+_RETRIABLE_STATUS = frozenset({408, 425, 429, *range(500, 600)})
+
 
 class RetryExhausted(Exception):
     """Raised when all retry attempts are exhausted."""
@@ -41,11 +49,13 @@ def is_retriable_http_error(exception: Exception) -> bool:
     Determine if an HTTP error is retriable.
 
     Retriable status codes:
+    - 408: Request Timeout
+    - 425: Too Early
     - 429: Too Many Requests (rate limiting)
     - 500-599: Server errors
 
     Non-retriable status codes:
-    - 400-499 (except 429): Client errors (bad request, not found, etc.)
+    - 400-499 (except 408, 425, 429): Client errors (bad request, not found, etc.)
 
     Args:
         exception: Exception to check
@@ -56,19 +66,8 @@ def is_retriable_http_error(exception: Exception) -> bool:
     if not isinstance(exception, HTTPError):
         return False
 
-    if exception.response is None:
-        return True
-
-    status_code = exception.response.status_code
-
-    # Retry on server errors and rate limiting
-    if status_code >= 500:
-        return True
-    if status_code == 429:
-        return True
-
-    # Don't retry on client errors
-    return False
+    response = exception.response
+    return response is None or response.status_code in _RETRIABLE_STATUS
 
 
 def calculate_backoff(
@@ -99,16 +98,22 @@ def calculate_backoff(
 
     # Add jitter (±10% of backoff time)
     if jitter:
-        jitter_amount = backoff * 0.1
-        backoff += random.uniform(-jitter_amount, jitter_amount)
+        backoff = _apply_jitter(backoff)
 
     return max(0, backoff)
 
 
+def _apply_jitter(backoff: float) -> float:
+    """Spread backoff uniformly across ±10% to prevent thundering herd."""
+    jitter_amount = backoff * 0.1
+    return backoff + _getrandbits(_JITTER_BITS) * (2 * jitter_amount / (1 << _JITTER_BITS)) - jitter_amount
+
+
 def retry_with_backoff(
     func: Callable[..., T],
     retry_config,
     *args,
+    deadline_ns: Optional[int] = None,
     **kwargs
 ) -> T:
     """
@@ -117,19 +122,22 @@ def retry_with_backoff(
     This function will retry on the following exceptions:
     - requests.Timeout
     - requests.ConnectionError
-    - requests.HTTPError (only if retriable - 5xx or 429)
+    - requests.HTTPError (only if retriable - 5xx, 408, 425 or 429)
 
     Args:
         func: Function to execute
         retry_config: RetryConfig instance with retry settings
         *args: Positional arguments to pass to func
+        deadline_ns: Optional time.monotonic_ns() value by which any retry
+            must have started; if the next backoff would end at or after
+            it, RetryExhausted is raised without sleeping
         **kwargs: Keyword arguments to pass to func
 
     Returns:
         Result from successful function execution
 
     Raises:
-        RetryExhausted: If all retries are exhausted
+        RetryExhausted: If all retries are exhausted or the deadline passes
         Exception: If a non-retriable exception occurs
 
     Example:
@@ -137,21 +145,31 @@ def retry_with_backoff(
         >>> config = RetryConfig(max_attempts=3)
         >>> result = retry_with_backoff(download_file, config, "http://example.com")
     """
+    max_attempts = retry_config.max_attempts
+    initial = retry_config.initial_backoff_seconds
+    multiplier = retry_config.backoff_multiplier
+    cap = retry_config.max_backoff_seconds
+    jitter = retry_config.jitter
+
+    # Built per call from the current config (RetryConfig is mutable), but
+    # once rather than per attempt
+    base_schedule = [min(initial * multiplier ** i, cap) for i in range(max_attempts - 1)]
     last_exception = None
 
-    for attempt in range(1, retry_config.max_attempts + 1):
+    for attempt in range(1, max_attempts + 1):
         try:
-            logger.debug(
-                f"Executing attempt {attempt}/{retry_config.max_attempts}",
-                attempt=attempt,
-                max_attempts=retry_config.max_attempts
-            )
+            if logger.debug_enabled:
+                logger.debug(
+                    "Executing attempt",
+                    attempt=attempt,
+                    max_attempts=max_attempts
+                )
 
             result = func(*args, **kwargs)
 
             if attempt > 1:
                 logger.info(
-                    f"Succeeded after {attempt} attempts",
+                    "Succeeded after retry",
                     attempt=attempt
                 )
 
@@ -161,7 +179,7 @@ def retry_with_backoff(
             # Always retriable
             last_exception = e
             logger.warning(
-                f"Retriable error on attempt {attempt}: {type(e).__name__}",
+                "Retriable error",
                 attempt=attempt,
                 error_type=type(e).__name__,
                 error_message=str(e)
@@ -172,7 +190,7 @@ def retry_with_backoff(
             if is_retriable_http_error(e):
                 status_code = e.response.status_code if e.response else None
                 logger.warning(
-                    f"Retriable HTTP error on attempt {attempt}",
+                    "Retriable HTTP error",
                     attempt=attempt,
                     status_code=status_code,
                     error_message=str(e)
@@ -198,17 +216,31 @@ def retry_with_backoff(
             raise
 
         # Don't sleep after the last attempt
-        if attempt < retry_config.max_attempts:
-            backoff_time = calculate_backoff(
-                attempt=attempt,
-                initial_backoff=retry_config.initial_backoff_seconds,
-                multiplier=retry_config.backoff_multiplier,
-                max_backoff=retry_config.max_backoff_seconds,
-                jitter=retry_config.jitter
-            )
+        if attempt < max_attempts:
+            backoff_time = base_schedule[attempt - 1]
+            if jitter:
+                backoff_time = max(0, _apply_jitter(backoff_time))
+
+            # A retry that could only start at or after the deadline would
+            # run with no budget left, so give up instead of sleeping to it
+            if deadline_ns is not None:
+                remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+                if backoff_time >= remaining:
+                    logger.error(
+                        "Retry deadline exceeded",
+                        attempt=attempt,
+                        backoff_seconds=round(backoff_time, 2),
+                        remaining_seconds=round(max(remaining, 0), 2),
+                        last_error=str(last_exception)
+                    )
+                    raise RetryExhausted(
+                        f"Deadline exceeded after {attempt} attempts: {last_exception}",
+                        attempts=attempt,
+                        last_exception=last_exception
+                    )
 
             logger.info(
-                f"Waiting {backoff_time:.2f}s before retry",
+                "Waiting before retry",
                 attempt=attempt,
                 backoff_seconds=round(backoff_time, 2)
             )
@@ -217,14 +249,14 @@ def retry_with_backoff(
 
     # All retries exhausted
     logger.error(
-        f"All {retry_config.max_attempts} retry attempts exhausted",
-        max_attempts=retry_config.max_attempts,
+        "All retry attempts exhausted",
+        max_attempts=max_attempts,
         last_error=str(last_exception) if last_exception else None
     )
 
     raise RetryExhausted(
-        f"Failed after {retry_config.max_attempts} attempts: {last_exception}",
-        attempts=retry_config.max_attempts,
+        f"Failed after {max_attempts} attempts: {last_exception}",
+        attempts=max_attempts,
         last_exception=last_exception
     )
 
@@ -256,56 +288,56 @@ def retry_decorator(retry_config):
 
 
 # Alternative: Using tenacity library (if installed)
-# This is a more feature-rich option but adds a dependency
-
-try:
-    from tenacity import (
-        retry,
-        stop_after_attempt,
-        wait_exponential,
-        retry_if_exception_type,
-        before_sleep_log,
-        after_log
-    )
+# This is a more feature-rich option but adds a dependency. It is imported
+# lazily so the collector's cold start doesn't pay for an unused import chain.
 
-    TENACITY_AVAILABLE = True
+TENACITY_AVAILABLE = importlib.util.find_spec("tenacity") is not None
 
-    def create_tenacity_retry_decorator(retry_config):
-        """
-        Create a retry decorator using the tenacity library.
 
-        This provides more advanced retry capabilities but requires
-        the tenacity package to be installed.
+def create_tenacity_retry_decorator(retry_config):
+    """
+    Create a retry decorator using the tenacity library.
 
-        Args:
-            retry_config: RetryConfig instance
+    This provides more advanced retry capabilities but requires
+    the tenacity package to be installed.
 
-        Returns:
-            Tenacity retry decorator
-        """
-        return retry(
-            stop=stop_after_attempt(retry_config.max_attempts),
-            wait=wait_exponential(
-                multiplier=retry_config.backoff_multiplier,
-                min=retry_config.initial_backoff_seconds,
-                max=retry_config.max_backoff_seconds
-            ),
-            retry=(
-                retry_if_exception_type(Timeout) |
-                retry_if_exception_type(ConnectionError) |
-                retry_if_exception_type(is_retriable_http_error)
-            ),
-            before_sleep=before_sleep_log(logging.getLogger(__name__), logging.WARNING),
-            after=after_log(logging.getLogger(__name__), logging.INFO),
-            reraise=True
-        )
+    Args:
+        retry_config: RetryConfig instance
 
-except ImportError:
-    TENACITY_AVAILABLE = False
+    Returns:
+        Tenacity retry decorator
 
-    def create_tenacity_retry_decorator(retry_config):
-        """Tenacity not available, fall back to manual retry."""
+    Raises:
+        ImportError: If tenacity is not installed
+    """
+    try:
+        from tenacity import (
+            retry,
+            stop_after_attempt,
+            wait_exponential,
+            retry_if_exception_type,
+            before_sleep_log,
+            after_log
+        )
+    except ImportError:
         raise ImportError(
             "tenacity library not installed. "
             "Use retry_with_backoff() or install with: pip install tenacity"
         )
+
+    return retry(
+        stop=stop_after_attempt(retry_config.max_attempts),
+        wait=wait_exponential(
+            multiplier=retry_config.backoff_multiplier,
+            min=retry_config.initial_backoff_seconds,
+            max=retry_config.max_backoff_seconds
+        ),
+        retry=(
+            retry_if_exception_type(Timeout) |
+            retry_if_exception_type(ConnectionError) |
+            retry_if_exception_type(is_retriable_http_error)
+        ),
+        before_sleep=before_sleep_log(logging.getLogger(__name__), logging.WARNING),
+        after=after_log(logging.getLogger(__name__), logging.INFO),
+        reraise=True
+    )
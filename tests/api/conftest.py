@@ -0,0 +1,12 @@
+"""
+Shared setup for Data API tests.
+
+The API Lambda is deployed from its own directory, so its modules are
+imported as top-level names (e.g. ``data_api``).
+"""
+
+import os
+import sys
+
+# Add api directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api'))
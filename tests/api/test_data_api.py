@@ -16,11 +16,6 @@ import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
 from io import BytesIO
-import sys
-import os
-
-# Add api directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api'))
 
 from data_api import (
     lambda_handler,
@@ -181,24 +176,40 @@ def _make_gzipped_s3_body(data: dict) -> MagicMock:
     return buf
 
 
+def _hourly_readings(hours, base_flow):
+    """Build hourly readings ending now, oldest first."""
+    now = datetime.now(timezone.utc)
+    return {
+        'historical_readings': [
+            {
+                'timestamp': (now - timedelta(hours=i)).isoformat(),
+                'flow_rate_m3s': base_flow + i
+            }
+            for i in range(hours, 0, -1)
+        ]
+    }
+
+
+@pytest.fixture(scope="module")
+def history_24h_mock():
+    """24 hourly readings, built once per module."""
+    return _hourly_readings(24, 15.0)
+
+
+@pytest.fixture(scope="module")
+def history_48h_mock():
+    """48 hourly readings, built once per module."""
+    return _hourly_readings(48, 10.0)
+
+
 @patch('data_api.s3_client')
 class TestHandleHistoricalFlow:
     """Test /history endpoint handler."""
 
-    def test_successful_historical_flow(self, mock_s3):
+    def test_successful_historical_flow(self, mock_s3, history_24h_mock):
         """Should return historical flow data with statistics."""
-        now = datetime.now(timezone.utc)
-        mock_data = {
-            'historical_readings': [
-                {
-                    'timestamp': (now - timedelta(hours=i)).isoformat(),
-                    'flow_rate_m3s': 15.0 + i
-                }
-                for i in range(24, 0, -1)
-            ]
-        }
         mock_s3.get_object.return_value = {
-            'Body': _make_gzipped_s3_body(mock_data)
+            'Body': _make_gzipped_s3_body(history_24h_mock)
         }
         mock_s3.exceptions.NoSuchKey = type('NoSuchKey', (Exception,), {})
 
@@ -217,20 +228,10 @@ class TestHandleHistoricalFlow:
         assert body['statistics']['min'] > 0
         assert body['statistics']['max'] > 0
 
-    def test_historical_flow_with_days_parameter(self, mock_s3):
+    def test_historical_flow_with_days_parameter(self, mock_s3, history_48h_mock):
         """Should support days parameter."""
-        now = datetime.now(timezone.utc)
-        mock_data = {
-            'historical_readings': [
-                {
-                    'timestamp': (now - timedelta(hours=i)).isoformat(),
-                    'flow_rate_m3s': 10.0 + i
-                }
-                for i in range(48, 0, -1)
-            ]
-        }
         mock_s3.get_object.return_value = {
-            'Body': _make_gzipped_s3_body(mock_data)
+            'Body': _make_gzipped_s3_body(history_48h_mock)
         }
         mock_s3.exceptions.NoSuchKey = type('NoSuchKey', (Exception,), {})
 
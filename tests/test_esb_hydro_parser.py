@@ -62,6 +62,14 @@ def test_parse_timestamp(parser):
     assert timestamp.second == 0
 
 
+def test_parse_timestamp_cached(parser):
+    """Test repeated timestamps are served from the parse cache."""
+    first = parser._parse_timestamp("06-Dec-25 09:00:00")
+    second = parser._parse_timestamp("06-Dec-25 09:00:00")
+
+    assert first is second
+
+
 def test_parse_timestamp_invalid(parser):
     """Test invalid timestamp raises error."""
     with pytest.raises(ValueError):
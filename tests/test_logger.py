@@ -0,0 +1,196 @@
+"""
+Unit tests for structured logging.
+"""
+
+import importlib.util
+import io
+import json
+import logging
+import sys
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.utils.logger import BufferedStreamHandler, JSONFormatter, LogContext, StructuredLogger, get_logger
+
+
+def _last_entry(caplog):
+    """Serialize the most recent captured record as the handler would."""
+    return json.loads(JSONFormatter().format(caplog.records[-1]))
+
+
+def test_log_entry_structure(caplog):
+    """Test that log output is JSON with the expected fields."""
+    logger = StructuredLogger("test.structure")
+
+    with caplog.at_level(logging.INFO):
+        logger.info("Processing started", station_id="inniscarra", count=5)
+
+    entry = _last_entry(caplog)
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "test.structure"
+    assert entry["message"] == "Processing started"
+    assert entry["context"] == {"station_id": "inniscarra", "count": 5}
+    assert entry["timestamp"].endswith("Z")
+    # Millisecond precision: 2025-12-01T14:05:23.123Z
+    assert len(entry["timestamp"]) == 24
+
+
+def test_none_context_values_filtered(caplog):
+    """Test that None context values are dropped."""
+    logger = StructuredLogger("test.filter")
+
+    with caplog.at_level(logging.INFO):
+        logger.info("Only none", value=None)
+
+    entry = _last_entry(caplog)
+    assert "context" not in entry
+
+
+def test_datetime_context_serialized(caplog):
+    """Test that datetime context values serialize as ISO 8601 UTC."""
+    logger = StructuredLogger("test.datetime")
+
+    with caplog.at_level(logging.INFO):
+        logger.info("With datetime", when=datetime(2025, 12, 5, 17, 0))
+
+    entry = _last_entry(caplog)
+    assert entry["context"]["when"] == "2025-12-05T17:00:00Z"
+
+
+def test_disabled_level_not_emitted(caplog):
+    """Test that records below the logger level are skipped."""
+    logger = StructuredLogger("test.disabled")
+
+    with caplog.at_level(logging.INFO):
+        assert logger.debug_enabled is False
+        logger.debug("Hidden", value=1)
+
+    assert caplog.records == []
+
+
+def test_debug_enabled_tracks_level(caplog):
+    """Test that debug_enabled reflects level changes."""
+    logger = StructuredLogger("test.debug_enabled")
+
+    with caplog.at_level(logging.DEBUG):
+        assert logger.debug_enabled is True
+        logger.debug("Shown")
+
+    assert _last_entry(caplog)["level"] == "DEBUG"
+
+
+def test_exception_included_in_entry(caplog):
+    """Test that tracebacks are embedded in the JSON entry."""
+    logger = StructuredLogger("test.exception")
+
+    with caplog.at_level(logging.ERROR):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Failed", station_id="inniscarra")
+
+    entry = _last_entry(caplog)
+    assert entry["message"] == "Failed"
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_formatter_passes_through_plain_records():
+    """Test that non-structured records use the normal format string."""
+    record = logging.LogRecord("other", logging.INFO, __file__, 1, "plain %s", ("text",), None)
+
+    assert JSONFormatter('%(message)s').format(record) == "plain text"
+
+
+def test_buffered_handler_batches_writes():
+    """Test that buffered records are written together on flush or error."""
+    stream = io.StringIO()
+    handler = BufferedStreamHandler(stream, capacity=10)
+    handler.setFormatter(JSONFormatter('%(message)s'))
+    logger = StructuredLogger("test.buffered")
+    logger.logger.addHandler(handler)
+    logger.logger.setLevel(logging.INFO)
+
+    try:
+        logger.info("First")
+        logger.info("Second")
+        assert stream.getvalue() == ""
+
+        logger.error("Failure")
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["First", "Second", "Failure"]
+
+        logger.info("Third")
+        handler.flush()
+        assert json.loads(stream.getvalue().splitlines()[-1])["message"] == "Third"
+    finally:
+        logger.logger.removeHandler(handler)
+
+
+def test_buffered_handler_write_errors_not_raised(monkeypatch):
+    """Test that a failing stream write is handled, not raised to the caller."""
+    class BrokenStream(io.StringIO):
+        def write(self, text):
+            raise BrokenPipeError("stdout closed")
+
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    handler = BufferedStreamHandler(BrokenStream(), capacity=10)
+    handler.setFormatter(JSONFormatter('%(message)s'))
+    logger = StructuredLogger("test.buffered.broken")
+    logger.logger.addHandler(handler)
+    logger.logger.setLevel(logging.INFO)
+
+    try:
+        logger.info("Buffered")
+        logger.error("Triggers flush")
+        assert handler.buffer == []
+    finally:
+        logger.logger.removeHandler(handler)
+
+
+def test_log_context_nesting():
+    """Test that nested LogContext blocks merge and restore context."""
+    assert LogContext.get_context() == {}
+
+    with LogContext(request_id="abc-123"):
+        with LogContext(station_id="inniscarra"):
+            assert LogContext.get_context() == {
+                "request_id": "abc-123",
+                "station_id": "inniscarra"
+            }
+        assert LogContext.get_context() == {"request_id": "abc-123"}
+
+    assert LogContext.get_context() == {}
+
+
+def test_get_logger_cached_per_name():
+    """Test that get_logger returns one instance per name."""
+    assert get_logger("test.cached") is get_logger("test.cached")
+    assert get_logger("test.cached") is not get_logger("test.cached.other")
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    """Test that the json fallback encodes log entries exactly as orjson does."""
+    pytest.importorskip("orjson")
+    from src.utils import logger as logger_module
+
+    # Load a second copy of the module with orjson hidden
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location("_logger_fallback", logger_module.__file__)
+    fallback = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(fallback)
+    assert not hasattr(fallback, "orjson")
+
+    entry = {
+        "naive": datetime(2025, 1, 1, 12, 30),
+        "utc": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "offset": datetime(2025, 1, 1, 1, 2, 3, 456, tzinfo=timezone(timedelta(hours=1))),
+        "text": "Inniscarra – café",
+        "number": 1.5,
+        "missing": None,
+        "other": Decimal("1.10"),
+    }
+
+    assert fallback._dumps(entry) == logger_module._dumps(entry)
+    assert json.loads(fallback._dumps(entry))["utc"] == "2025-01-01T00:00:00Z"
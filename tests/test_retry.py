@@ -4,6 +4,8 @@ Unit tests for retry logic.
 Tests cover exponential backoff, retry exhaustion, retriable vs non-retriable errors.
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 from requests.exceptions import ConnectionError, HTTPError, Timeout
@@ -83,6 +85,73 @@ def test_exponential_backoff_timing(mock_sleep):
     assert mock_sleep.call_count == 2
 
 
+@patch('time.sleep')
+def test_retry_backoff_follows_config_changes(mock_sleep):
+    """Test that the capped backoff schedule reflects fields changed after construction."""
+    mock_func = Mock()
+    mock_func.side_effect = ConnectionError("Fail")
+
+    config = RetryConfig(
+        max_attempts=2,
+        initial_backoff_seconds=10.0,
+        max_backoff_seconds=30.0,
+        jitter=False
+    )
+    config.max_attempts = 5
+
+    with pytest.raises(RetryExhausted) as exc_info:
+        retry_with_backoff(mock_func, config)
+
+    assert exc_info.value.attempts == 5
+    assert [c[0][0] for c in mock_sleep.call_args_list] == [10.0, 20.0, 30.0, 30.0]
+
+
+@patch('time.sleep')
+def test_retry_deadline_stops_before_long_backoff(mock_sleep):
+    """Test that a backoff ending past the deadline gives up instead of sleeping."""
+    mock_func = Mock()
+    mock_func.side_effect = [ConnectionError("Fail"), "success"]
+
+    config = RetryConfig(max_attempts=3, initial_backoff_seconds=30.0, jitter=False)
+    deadline_ns = time.monotonic_ns() + 2_000_000_000
+
+    with pytest.raises(RetryExhausted) as exc_info:
+        retry_with_backoff(mock_func, config, deadline_ns=deadline_ns)
+
+    assert mock_func.call_count == 1
+    assert exc_info.value.attempts == 1
+    mock_sleep.assert_not_called()
+
+
+@patch('time.sleep')
+def test_retry_deadline_allows_backoff_within_budget(mock_sleep):
+    """Test that retries continue while the backoff ends before the deadline."""
+    mock_func = Mock()
+    mock_func.side_effect = [ConnectionError("Fail"), "success"]
+
+    config = RetryConfig(max_attempts=3, initial_backoff_seconds=1.0, jitter=False)
+    deadline_ns = time.monotonic_ns() + 60_000_000_000
+
+    assert retry_with_backoff(mock_func, config, deadline_ns=deadline_ns) == "success"
+    mock_sleep.assert_called_once_with(1.0)
+
+
+@patch('time.sleep')
+def test_retry_deadline_exceeded(mock_sleep):
+    """Test that no further attempts are made once the deadline has passed."""
+    mock_func = Mock()
+    mock_func.side_effect = ConnectionError("Fail")
+
+    config = RetryConfig(max_attempts=3)
+
+    with pytest.raises(RetryExhausted) as exc_info:
+        retry_with_backoff(mock_func, config, deadline_ns=time.monotonic_ns() - 1)
+
+    assert mock_func.call_count == 1
+    assert exc_info.value.attempts == 1
+    mock_sleep.assert_not_called()
+
+
 def test_is_retriable_http_error_500():
     """Test that 500 errors are retriable."""
     mock_response = Mock()
@@ -101,6 +170,15 @@ def test_is_retriable_http_error_429():
     assert is_retriable_http_error(error) is True
 
 
+def test_is_retriable_http_error_408():
+    """Test that 408 (request timeout) errors are retriable."""
+    mock_response = Mock()
+    mock_response.status_code = 408
+    error = HTTPError(response=mock_response)
+
+    assert is_retriable_http_error(error) is True
+
+
 def test_is_retriable_http_error_404():
     """Test that 404 errors are not retriable."""
     mock_response = Mock()
@@ -126,6 +126,8 @@ def test_upload_parsed_json(storage, sample_parsed_data):
     json_content = gzip.decompress(compressed_content)
     data = json.loads(json_content)
 
+    # Gzip header mtime is zeroed so identical content gives identical bytes
+    assert compressed_content[4:8] == b"\x00\x00\x00\x00"
     assert data['station'] == "Inniscarra"
     assert data['river'] == "River Lee"
     assert data['current_reading']['flow_rate_m3s'] == 127.0
@@ -178,6 +180,14 @@ def test_update_latest_aggregated(storage, sample_parsed_data):
     assert data['latest_reading']['flow_rate_m3s'] == 127.0
     assert 'updated_at' in data
     assert 'statistics' in data
+    assert data['statistics']['current_flow_m3s'] == 127.0
+    assert 'current_water_level_m' not in data['statistics']
+
+    head = storage.s3.head_object(
+        Bucket=storage.config.bucket_name,
+        Key=s3_key
+    )
+    assert head['Metadata']['flow-rate'] == "127.0"
 
 
 def test_get_latest_reading(storage, sample_parsed_data):
@@ -112,6 +112,39 @@ def test_s3_config_key_generation():
     assert latest_key == "aggregated/inniscarra_latest.json"
 
 
+def test_s3_config_key_cache_respects_prefixes():
+    """Test memoized keys are not shared between configs with different prefixes."""
+    default = S3Config(bucket_name="test-bucket")
+    custom = S3Config(
+        bucket_name="test-bucket",
+        raw_prefix="archive",
+        parsed_prefix="json",
+        aggregated_prefix="agg"
+    )
+
+    for _ in range(2):
+        assert default.get_raw_key("inniscarra", "20251201_140523", "a.pdf") == \
+            "raw/inniscarra/2025/12/01/a.pdf"
+        assert custom.get_raw_key("inniscarra", "20251201_140523", "a.pdf") == \
+            "archive/inniscarra/2025/12/01/a.pdf"
+        assert default.get_parsed_key("inniscarra", "202512").startswith("parsed/")
+        assert custom.get_parsed_key("inniscarra", "202512").startswith("json/")
+        assert default.get_latest_key("inniscarra") == "aggregated/inniscarra_latest.json"
+        assert custom.get_latest_key("inniscarra") == "agg/inniscarra_latest.json"
+
+
+def test_s3_config_raw_key_varies_by_time_and_filename():
+    """Test raw keys sharing a day directory keep their own filenames."""
+    config = S3Config(bucket_name="test-bucket")
+
+    assert config.get_raw_key("inniscarra", "20251201_140523", "a.pdf") == \
+        "raw/inniscarra/2025/12/01/a.pdf"
+    assert config.get_raw_key("inniscarra", "20251201_150523", "b.pdf") == \
+        "raw/inniscarra/2025/12/01/b.pdf"
+    assert config.get_raw_key("inniscarra", "20251202_000000", "b.pdf") == \
+        "raw/inniscarra/2025/12/02/b.pdf"
+
+
 def test_settings_from_dict():
     """Test creating Settings from dictionary."""
     config_dict = {
@@ -136,6 +136,46 @@ invalid-row
     assert readings[1][1] == 1.580
 
 
+def test_parse_csv_timestamp_formats(parser):
+    """Test CSV parsing accepts HH:MM and unpadded timestamps, rejects other ISO forms."""
+    csv_data = b"""2025-12-06 14:30,1.590
+2025-12-06,1.585
+20251206T141500Z,1.580
+2025-12-06T14:00:00,1.575
+2025-12-06 9:45:00,1.570
+2025-12-6 9:30,1.565
+"""
+
+    readings = parser._parse_csv(csv_data)
+
+    assert readings == [
+        (datetime(2025, 12, 6, 14, 30, 0), 1.590),
+        (datetime(2025, 12, 6, 9, 45, 0), 1.570),
+        (datetime(2025, 12, 6, 9, 30, 0), 1.565),
+    ]
+
+
+def test_parse_csv_with_quoted_fields(parser):
+    """Test CSV parsing handles quoted fields."""
+    csv_data = b'''"2025-12-06 14:30:00","1.590"
+"2025-12-06 14:15:00","1.585"
+'''
+
+    readings = parser._parse_csv(csv_data)
+
+    assert len(readings) == 2
+    assert readings[0] == (datetime(2025, 12, 6, 14, 30, 0), 1.590)
+
+
+def test_parse_csv_latin1_fallback(parser):
+    """Test CSV parsing falls back to latin-1 for non-UTF-8 content."""
+    csv_data = "timestamp,valeur \xb0C\n2025-12-06 14:30:00,8.5\n".encode('latin-1')
+
+    readings = parser._parse_csv(csv_data)
+
+    assert readings == [(datetime(2025, 12, 6, 14, 30, 0), 8.5)]
+
+
 def test_combine_readings(parser):
     """Test combining level and temperature readings."""
     level_readings = [
@@ -180,43 +220,88 @@ def test_combine_readings_missing_temperature(parser):
     assert combined[1].temperature_c is None  # No matching temp within 2-hour window
 
 
-def test_find_matching_temp_exact_match(parser):
-    """Test finding temperature with exact timestamp match."""
-    temp_dict = {
-        datetime(2025, 12, 6, 14, 30, 0): 8.5,
-        datetime(2025, 12, 6, 14, 15, 0): 8.4,
-    }
+def test_combine_readings_duplicate_timestamps(parser):
+    """Test that the last duplicate temperature wins, even on a shared grid."""
+    level_readings = [
+        (datetime(2025, 12, 6, 14, 30, 0), 1.59),
+        (datetime(2025, 12, 6, 14, 30, 0), 1.58),
+    ]
+    temp_readings = [
+        (datetime(2025, 12, 6, 14, 30, 0), 8.5),
+        (datetime(2025, 12, 6, 14, 30, 0), 8.6),
+    ]
 
-    temp = parser._find_matching_temp(datetime(2025, 12, 6, 14, 30, 0), temp_dict)
-    assert temp == 8.5
+    combined = parser._combine_readings(level_readings, temp_readings)
 
+    assert [r.temperature_c for r in combined] == [8.6, 8.6]
 
-def test_find_matching_temp_within_window(parser):
-    """Test finding temperature within 5-minute window."""
-    temp_dict = {
-        datetime(2025, 12, 6, 14, 30, 0): 8.5,
-    }
 
+def test_combine_readings_no_temperature_overlap(parser):
+    """Test combining when no temperature falls near the level time range."""
+    level_readings = [
+        (datetime(2025, 12, 6, 14, 30, 0), 1.59),
+        (datetime(2025, 12, 6, 14, 15, 0), 1.58),
+    ]
+
+    for temp_readings in ([], [(datetime(2025, 12, 6, 8, 0, 0), 8.5)], [(datetime(2025, 12, 6, 20, 0, 0), 8.5)]):
+        combined = parser._combine_readings(level_readings, temp_readings)
+
+        assert [r.water_level_m for r in combined] == [1.59, 1.58]
+        assert all(r.temperature_c is None for r in combined)
+
+
+def test_combine_readings_exact_match(parser):
+    """Test that an exact timestamp match wins over a closer-by-order reading."""
+    level_readings = [(datetime(2025, 12, 6, 14, 30, 0), 1.59)]
+    temp_readings = [
+        (datetime(2025, 12, 6, 14, 30, 0), 8.5),
+        (datetime(2025, 12, 6, 14, 15, 0), 8.4),
+    ]
+
+    combined = parser._combine_readings(level_readings, temp_readings)
+    assert combined[0].temperature_c == 8.5
+
+
+def test_combine_readings_within_window(parser):
+    """Test matching a temperature a few minutes away."""
     # 2 minutes after - should match
-    temp = parser._find_matching_temp(datetime(2025, 12, 6, 14, 32, 0), temp_dict)
-    assert temp == 8.5
+    level_readings = [(datetime(2025, 12, 6, 14, 32, 0), 1.59)]
+    temp_readings = [(datetime(2025, 12, 6, 14, 30, 0), 8.5)]
 
+    combined = parser._combine_readings(level_readings, temp_readings)
+    assert combined[0].temperature_c == 8.5
 
-def test_find_matching_temp_outside_window(parser):
-    """Test that temperature outside 2-hour window returns None."""
-    temp_dict = {
-        datetime(2025, 12, 6, 14, 30, 0): 8.5,
-    }
 
+def test_combine_readings_outside_window(parser):
+    """Test that temperature outside 2-hour window is not matched."""
     # 2 hours 1 minute after - should not match
-    temp = parser._find_matching_temp(datetime(2025, 12, 6, 16, 31, 0), temp_dict)
-    assert temp is None
+    level_readings = [(datetime(2025, 12, 6, 16, 31, 0), 1.59)]
+    temp_readings = [(datetime(2025, 12, 6, 14, 30, 0), 8.5)]
+
+    combined = parser._combine_readings(level_readings, temp_readings)
+    assert combined[0].temperature_c is None
+
 
+def test_combine_readings_closest_neighbour(parser):
+    """Test that the closest reading on either side is chosen."""
+    level_readings = [
+        (datetime(2025, 12, 6, 16, 0, 0), 1.65),
+        (datetime(2025, 12, 6, 14, 40, 0), 1.64),
+        (datetime(2025, 12, 6, 14, 30, 0), 1.63),
+        (datetime(2025, 12, 6, 14, 20, 0), 1.62),
+        (datetime(2025, 12, 6, 12, 0, 0), 1.61),
+    ]
+    temp_readings = [
+        (datetime(2025, 12, 6, 15, 0, 0), 8.3),
+        (datetime(2025, 12, 6, 14, 0, 0), 8.2),
+        (datetime(2025, 12, 6, 13, 0, 0), 8.1),
+    ]
+
+    combined = parser._combine_readings(level_readings, temp_readings)
 
-def test_find_matching_temp_no_data(parser):
-    """Test finding temperature with empty dict."""
-    temp = parser._find_matching_temp(datetime(2025, 12, 6, 14, 30, 0), {})
-    assert temp is None
+    # After the last reading, 14:40 and 14:30 (equidistant: the later
+    # reading wins), 14:20, and before the first reading
+    assert [r.temperature_c for r in combined] == [8.3, 8.3, 8.3, 8.2, 8.1]
 
 
 def test_parse_full(parser, sample_level_csv, sample_temp_csv):